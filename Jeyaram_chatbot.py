@@ -1,8 +1,298 @@
 import json
+import mmap
 import re
-from datetime import datetime
+import struct
+import sys
+import zlib
+from array import array
+from collections.abc import Mapping
+from datetime import date, datetime
 
 # --- Part 1: Dummy Tools ---
+class KeywordClassifier:
+    # Data-driven replacement for an if/elif chain of any(word in text ...) scans.
+    # keyword_table is an ordered dict {category: [keywords]}; its order is the priority order used to break ties.
+    def __init__(self, keyword_table: dict, default: str):
+        self.categories = list(keyword_table.keys())
+        self.default = default
+
+        keyword_categories = {} # keyword -> list of category indexes (a keyword like "broken" can belong to many)
+        for index, keywords in enumerate(keyword_table.values()):
+            for keyword in keywords:
+                keyword = keyword.lower()
+                if index not in keyword_categories.setdefault(keyword, []):
+                    keyword_categories[keyword].append(index)
+
+        # Flat table of unique keywords, sorted by the first (highest priority) category they belong to.
+        # The first keyword found in the text therefore always gives the same answer as the if/elif chain.
+        self.table = tuple(sorted(
+            ((keyword, tuple(indexes)) for keyword, indexes in keyword_categories.items()),
+            key=lambda entry: entry[1][0]
+        ))
+        # sorted() is stable, so keywords keep their original order inside the same category
+
+    def score(self, text: str) -> dict:
+        # Number of keyword occurrences per category, every category is present (0 when nothing matched)
+        text_lower = text.lower() # Lower-case the text only once
+        counts = [0] * len(self.categories)
+        for keyword, indexes in self.table:
+            occurrences = text_lower.count(keyword) # One scan of the text per unique keyword
+            if occurrences:
+                for index in indexes:
+                    counts[index] += occurrences
+        return dict(zip(self.categories, counts))
+
+    def classify(self, text: str) -> str:
+        # The first category (in priority order) with any keyword wins, ties never depend on the text
+        text_lower = text.lower() # Lower-case the text only once
+        for keyword, indexes in self.table:
+            if keyword in text_lower:
+                return self.categories[indexes[0]]
+        return self.default
+
+
+ORDER_SCHEMA = [("status", "enum"), ("estimated_delivery", "date"), ("delivery_date", "date")]
+PRODUCT_SCHEMA = [("description", "text"), ("price", "price"), ("in_stock", "bool")]
+
+
+class CompactTable(Mapping):
+    # Read-only, columnar replacement for a dict of dicts like dummy_orders / dummy_products.
+    # It behaves like the dict (in, [], .keys(), .get()) so the tools need no code change, but every record
+    # lives in flat array columns instead of one dict + several str objects (~10-40 bytes instead of ~400).
+    #
+    # schema: list of (field, kind) in record order. kinds:
+    #   "enum"  ---> interned strings (Eg: status), 1 byte code per record, 0 means the field is absent
+    #   "date"  ---> "YYYY-MM-DD" stored as date.toordinal() in a 4 byte int, 0 means absent
+    #   "price" ---> "$1200" / "$19.99" stored as cents in an 8 byte int, -1 means absent
+    #   "bool"  ---> 1 byte, 2 means absent
+    #   "text"  ---> utf-8 bytes packed in one blob + 4 byte end offsets, always required
+    # The field order of every record is kept as a 1 byte code into a list of layouts (Eg: ("status", "delivery_date")),
+    # so a record comes back with its keys in the same order as the source dictionary.
+    # Keys are packed like "text" and found through an open-addressing hash index of row numbers (crc32 of the key).
+    MAGIC = b"CTBL0001"
+
+    def __init__(self, schema: list, count: int, sections: dict, enums: dict, layouts: list, buffer=None):
+        self.schema = [tuple(column) for column in schema]
+        self.kinds = dict(self.schema) # field -> kind
+        self.count = count
+        self.sections = sections # section name -> array / memoryview column
+        self.enums = enums # enum field -> list of values (code - 1 is the position in the list)
+        self.layouts = [tuple(layout) for layout in layouts] # record.layout code -> field order of the record
+        self.buffer = buffer # Keeps the memory-mapped file open while the columns point into it
+        self.last_lookup = (None, -1) # (key, row) of the last _find(), Eg: execute() does `in` and then []
+
+    @classmethod
+    def from_records(cls, records: dict, schema: list):
+        # Eg: CompactTable.from_records({"ORD123": {"status": "Shipped", ...}}, ORDER_SCHEMA)
+        fields = [field for field, _ in schema]
+        columns = {field: [] for field in fields}
+        layouts = {} # field order -> layout code, Eg: {("status", "estimated_delivery"): 0}
+        layout_codes = array("B")
+        for key, record in records.items():
+            unknown = set(record) - set(fields)
+            if unknown:
+                raise ValueError(f"Record {key!r} has fields {sorted(unknown)} that are not in the schema.")
+            if None in record.values():
+                raise ValueError(f"Record {key!r} has a None value, leave the field out instead.")
+            for field in fields:
+                columns[field].append(record.get(field, None)) # None marks a field the record does not have
+            layout = tuple(record.keys())
+            if layout not in layouts:
+                if len(layouts) == 256:
+                    raise ValueError("Records use more than 256 different field orders.")
+                layouts[layout] = len(layouts)
+            layout_codes.append(layouts[layout])
+
+        sections, enums = {}, {}
+        sections["key.blob"], sections["key.offsets"] = cls._pack_text("key", list(records.keys()))
+        sections["record.layout"] = layout_codes
+        for field, kind in schema:
+            values = columns[field]
+            if kind == "enum":
+                if any(value is not None and not isinstance(value, str) for value in values):
+                    raise ValueError(f"Enum column '{field}' holds a value that is not a string.")
+                enums[field] = list(dict.fromkeys(value for value in values if value is not None))
+                if len(enums[field]) > 255:
+                    raise ValueError(f"Enum column '{field}' has more than 255 distinct values.")
+                codes = {value: code for code, value in enumerate(enums[field], start=1)}
+                sections[field] = array("B", [0 if value is None else codes[value] for value in values])
+            elif kind == "date":
+                sections[field] = array("i", [0 if value is None else cls._pack_date(value) for value in values])
+            elif kind == "price":
+                sections[field] = array("q", [-1 if value is None else cls._pack_price(value) for value in values])
+            elif kind == "bool":
+                if any(value is not None and not isinstance(value, bool) for value in values):
+                    raise ValueError(f"Bool column '{field}' holds a value that is not True/False.")
+                sections[field] = array("B", [2 if value is None else int(value) for value in values])
+            elif kind == "text":
+                sections[field + ".blob"], sections[field + ".offsets"] = cls._pack_text(field, values)
+            else:
+                raise ValueError(f"Unknown column kind '{kind}' for field '{field}'.")
+
+        sections["key.index"] = cls._build_index(sections["key.blob"], sections["key.offsets"])
+        return cls(schema, len(records), sections, enums, list(layouts))
+
+    @staticmethod
+    def _pack_text(field: str, values: list):
+        if any(not isinstance(value, str) for value in values):
+            raise ValueError(f"Text column '{field}' must hold a string for every record.")
+        encoded = [value.encode("utf-8") for value in values]
+        offsets = array("I", [0])
+        end = 0
+        for data in encoded:
+            end += len(data)
+            offsets.append(end)
+        # offsets[row] and offsets[row + 1] are the start and end of the row inside the blob
+        return b"".join(encoded), offsets
+
+    @staticmethod
+    def _pack_date(value: str) -> int:
+        if not isinstance(value, str):
+            raise ValueError(f"Date {value!r} is not in YYYY-MM-DD format.")
+        ordinal = date.fromisoformat(value).toordinal()
+        if date.fromordinal(ordinal).isoformat() != value:
+            raise ValueError(f"Date {value!r} is not in YYYY-MM-DD format.")
+        return ordinal
+
+    @staticmethod
+    def _pack_price(value: str) -> int:
+        match = re.fullmatch(r"\$(\d+)(?:\.(\d\d))?", value) if isinstance(value, str) else None
+        if not match:
+            raise ValueError(f"Price {value!r} is not in '$123' or '$123.45' format.")
+        cents = int(match.group(1)) * 100 + int(match.group(2) or 0)
+        if CompactTable._unpack_price(cents) != value: # Eg: "$012" or "$5.00" would not come back unchanged
+            raise ValueError(f"Price {value!r} cannot be stored without changing its text.")
+        return cents
+
+    @staticmethod
+    def _unpack_price(cents: int) -> str:
+        if cents % 100:
+            return f"${cents // 100}.{cents % 100:02d}"
+        return f"${cents // 100}"
+
+    @staticmethod
+    def _build_index(blob, offsets):
+        count = len(offsets) - 1
+        size = count * 3 // 2 + 1 # ~67% load factor, at least one empty slot so lookups always stop
+        index = array("I", [0]) * size # 0 means empty, otherwise row + 1
+        for row in range(count):
+            # zlib.crc32() is used instead of hash() because hash() of str changes between processes
+            slot = zlib.crc32(blob[offsets[row]:offsets[row + 1]]) % size
+            while index[slot]:
+                slot = (slot + 1) % size # Linear probing
+            index[slot] = row + 1
+        return index
+
+    def _find(self, key) -> int:
+        if not isinstance(key, str):
+            return -1
+        last_key, last_row = self.last_lookup
+        if key == last_key: # The table is read-only, so a cached row (or miss) never goes stale
+            return last_row
+        row = self._probe(key)
+        self.last_lookup = (key, row) # One tuple assignment, so threads never see a key with another key's row
+        return row
+
+    def _probe(self, key: str) -> int:
+        try:
+            data = key.encode("utf-8")
+        except UnicodeEncodeError: # Eg: "ORD\udcff", a lone surrogate can never be one of the stored keys
+            return -1
+        blob, offsets, index = self.sections["key.blob"], self.sections["key.offsets"], self.sections["key.index"]
+        size = len(index)
+        slot = zlib.crc32(data) % size
+        while index[slot]:
+            row = index[slot] - 1
+            if blob[offsets[row]:offsets[row + 1]] == data:
+                return row
+            slot = (slot + 1) % size
+        return -1
+
+    def _text(self, field: str, row: int) -> str:
+        offsets = self.sections[field + ".offsets"]
+        return str(self.sections[field + ".blob"][offsets[row]:offsets[row + 1]], "utf-8")
+
+    def _record(self, row: int) -> dict:
+        record = {}
+        for field in self.layouts[self.sections["record.layout"][row]]: # Only the fields the record had, in its own order
+            kind = self.kinds[field]
+            if kind == "text":
+                record[field] = self._text(field, row)
+                continue
+            value = self.sections[field][row]
+            if kind == "enum":
+                record[field] = self.enums[field][value - 1]
+            elif kind == "date":
+                record[field] = date.fromordinal(value).isoformat()
+            elif kind == "price":
+                record[field] = self._unpack_price(value)
+            elif kind == "bool":
+                record[field] = bool(value)
+        return record
+
+    def __getitem__(self, key) -> dict:
+        row = self._find(key)
+        if row < 0:
+            raise KeyError(key)
+        return self._record(row) # A fresh dict every time, changing it does not change the table
+
+    def __contains__(self, key) -> bool:
+        return self._find(key) >= 0
+
+    def __iter__(self):
+        for row in range(self.count): # Insertion order, like a dict
+            yield self._text("key", row)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def nbytes(self) -> int:
+        # Total size of all columns (the file size minus the small JSON header)
+        return sum(memoryview(section).nbytes for section in self.sections.values())
+
+    def save(self, path: str):
+        header = {"schema": self.schema, "count": self.count, "enums": self.enums, "layouts": self.layouts,
+                  "byteorder": sys.byteorder, "sections": {}}
+        offset = 0
+        for name, section in self.sections.items():
+            view = memoryview(section)
+            header["sections"][name] = [view.format, offset, view.nbytes]
+            offset += (view.nbytes + 7) // 8 * 8 # Every section starts on an 8 byte boundary
+        header_bytes = json.dumps(header).encode("utf-8")
+        start = (len(self.MAGIC) + 8 + len(header_bytes) + 7) // 8 * 8
+
+        with open(path, "wb") as f:
+            f.write(self.MAGIC + struct.pack("<Q", len(header_bytes)) + header_bytes)
+            for name, section in self.sections.items():
+                f.seek(start + header["sections"][name][1])
+                f.write(memoryview(section))
+            f.truncate(start + offset)
+
+    @classmethod
+    def load(cls, path: str):
+        # Memory-maps the file read-only: nothing is copied, pages are loaded on first use and
+        # every worker process that loads the same file shares them through the OS page cache.
+        with open(path, "rb") as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        # mmap keeps its own handle, so the file object can be closed right away
+
+        if buffer[:len(cls.MAGIC)] != cls.MAGIC:
+            raise ValueError(f"{path} is not a CompactTable file.")
+        (header_length,) = struct.unpack_from("<Q", buffer, len(cls.MAGIC))
+        header_start = len(cls.MAGIC) + 8
+        header = json.loads(buffer[header_start:header_start + header_length].decode("utf-8"))
+        if header["byteorder"] != sys.byteorder:
+            raise ValueError(f"{path} was written on a {header['byteorder']}-endian machine.")
+        start = (header_start + header_length + 7) // 8 * 8
+
+        view = memoryview(buffer)
+        sections = {}
+        for name, (typecode, offset, nbytes) in header["sections"].items():
+            sections[name] = view[start + offset:start + offset + nbytes].cast(typecode)
+        enums = {field: [sys.intern(value) for value in values] for field, values in header["enums"].items()}
+        return cls(header["schema"], header["count"], sections, enums, header["layouts"], buffer=buffer)
+
+
 class Tool:
     def __init__(self, name, description):
         self.name = name
@@ -13,7 +303,7 @@ class Tool:
 
 
 class OrderDBTool(Tool):
-    def __init__(self):
+    def __init__(self, orders: Mapping = None): # orders: Optional CompactTable (or dict) to use instead of the dummy orders
         super().__init__(
             name="OrderDBTool",
             description="Use this tool to get information about a customer's order status. Requires 'order_id'."
@@ -24,6 +314,8 @@ class OrderDBTool(Tool):
             "ORD789": {"status": "Delivered", "delivery_date": "2025-05-10"},
             "ORD741": {"status": "Delivered", "delivery_date": "2025-05-10"},
         }
+        if orders is not None:
+            self.dummy_orders = orders # Eg: OrderDBTool(orders=CompactTable.load("orders.tbl"))
 
     def execute(self, order_id: str = None):
         if not order_id:
@@ -41,7 +333,7 @@ class OrderDBTool(Tool):
 # f"...."" ---> To embed expressions or variables directly inside a string using {}.
 
 class ProductInfoTool(Tool):
-    def __init__(self):
+    def __init__(self, products: Mapping = None): # products: Optional CompactTable (or dict) to use instead of the dummy products
         super().__init__(
             name="ProductInfoTool",
             description="Use this tool to get information about a product. Requires 'product_name'."
@@ -51,6 +343,8 @@ class ProductInfoTool(Tool):
             "mouse": {"description": "An ergonomic wireless mouse.", "price": "$25", "in_stock": False},
             "keyboard": {"description": "A mechanical gaming keyboard.", "price": "$75", "in_stock": True},
         }
+        if products is not None:
+            self.dummy_products = products # Eg: ProductInfoTool(products=CompactTable.load("products.tbl"))
 
     def execute(self, product_name: str = None):
         if not product_name:
@@ -143,22 +437,21 @@ class OrderIssuesTool(Tool):
             }
         }
 
+    # intent matching with issue_resolutions keys, listed in priority order ("broken" is damaged before defective)
+    issue_keywords = {
+        "not_received": ["not received", "didn't receive", "haven't got", "missing", "lost"],
+        "damaged": ["damaged", "broken", "cracked", "smashed"],
+        "wrong_item": ["wrong", "incorrect", "different", "not what i ordered"],
+        "defective": ["defective", "not working", "faulty", "doesn't work", "broken"],
+        "late_delivery": ["late", "delayed", "slow", "taking too long"],
+    }
+    issue_classifier = KeywordClassifier(issue_keywords, default="general_issue") # Compiled once for all instances
+
     def classify_issue(self, description: str) -> str: # -> str means It Returns a string
-        description_lower = description.lower() # Case-insensitive 
-
-        # intent matching with issue_resolutions keys
-        if any(word in description_lower for word in ["not received", "didn't receive", "haven't got", "missing", "lost"]): 
-            return "not_received"
-        elif any(word in description_lower for word in ["damaged", "broken", "cracked", "smashed"]):
-            return "damaged"
-        elif any(word in description_lower for word in ["wrong", "incorrect", "different", "not what i ordered"]):
-            return "wrong_item"
-        elif any(word in description_lower for word in ["defective", "not working", "faulty", "doesn't work", "broken"]):
-            return "defective"
-        elif any(word in description_lower for word in ["late", "delayed", "slow", "taking too long"]):
-            return "late_delivery"
-        else:
-            return "general_issue"
+        return self.issue_classifier.classify(description) # Case-insensitive
+
+    def score_issue(self, description: str) -> dict:
+        return self.issue_classifier.score(description) # Eg: {"not_received": 0, "damaged": 1, ...}
 
     def execute(self, order_id: str = None, issue_type: str = None, description: str = None):
         if not order_id:
@@ -236,20 +529,20 @@ class GeneralInquiryTool(Tool):
             }
         }
 
+    # intent matching with inquiry_responses keys, listed in priority order
+    inquiry_keywords = {
+        "complaint": ["complain", "disappointed", "terrible", "awful", "bad experience", "unhappy"],
+        "feedback": ["feedback", "suggestion", "improve", "better"],
+        "business_hours": ["hours", "open", "available", "when"],
+        "contact_info": ["contact", "phone", "email", "reach"],
+    }
+    inquiry_classifier = KeywordClassifier(inquiry_keywords, default="general_question") # Compiled once for all instances
+
     def classify_inquiry(self, text: str) -> str: # -> str means It Returns a string
-        text_lower = text.lower()  # Case-insensitive 
-        
-        # intent matching with inquiry_responses keys
-        if any(word in text_lower for word in ["complain", "disappointed", "terrible", "awful", "bad experience", "unhappy"]):
-            return "complaint"
-        elif any(word in text_lower for word in ["feedback", "suggestion", "improve", "better"]):
-            return "feedback"
-        elif any(word in text_lower for word in ["hours", "open", "available", "when"]):
-            return "business_hours"
-        elif any(word in text_lower for word in ["contact", "phone", "email", "reach"]):
-            return "contact_info"
-        else:
-            return "general_question"
+        return self.inquiry_classifier.classify(text) # Case-insensitive
+
+    def score_inquiry(self, text: str) -> dict:
+        return self.inquiry_classifier.score(text) # Eg: {"complaint": 2, "feedback": 0, ...}
 
     def execute(self, inquiry_type: str = None, message: str = None):
         if not message:
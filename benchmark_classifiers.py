@@ -0,0 +1,91 @@
+import random
+import time
+
+from Jeyaram_chatbot import GeneralInquiryTool, OrderIssuesTool
+
+# --- Original if/elif classifiers, kept here as the baseline ---
+def legacy_classify_issue(description: str) -> str:
+    description_lower = description.lower()
+    if any(word in description_lower for word in ["not received", "didn't receive", "haven't got", "missing", "lost"]):
+        return "not_received"
+    elif any(word in description_lower for word in ["damaged", "broken", "cracked", "smashed"]):
+        return "damaged"
+    elif any(word in description_lower for word in ["wrong", "incorrect", "different", "not what i ordered"]):
+        return "wrong_item"
+    elif any(word in description_lower for word in ["defective", "not working", "faulty", "doesn't work", "broken"]):
+        return "defective"
+    elif any(word in description_lower for word in ["late", "delayed", "slow", "taking too long"]):
+        return "late_delivery"
+    else:
+        return "general_issue"
+
+
+def legacy_classify_inquiry(text: str) -> str:
+    text_lower = text.lower()
+    if any(word in text_lower for word in ["complain", "disappointed", "terrible", "awful", "bad experience", "unhappy"]):
+        return "complaint"
+    elif any(word in text_lower for word in ["feedback", "suggestion", "improve", "better"]):
+        return "feedback"
+    elif any(word in text_lower for word in ["hours", "open", "available", "when"]):
+        return "business_hours"
+    elif any(word in text_lower for word in ["contact", "phone", "email", "reach"]):
+        return "contact_info"
+    else:
+        return "general_question"
+
+
+FILLER = ("the package order item box customer support week today yesterday please help "
+          "my account refund tracking number arrived store website checkout").split()
+
+
+def make_text(keywords: list, rng: random.Random, words: int) -> str:
+    # Long complaint text: mostly filler with a few keywords sprinkled in (sometimes glued together or upper-cased)
+    parts = [rng.choice(FILLER) for _ in range(words)]
+    for _ in range(rng.randint(0, 3)):
+        keyword = rng.choice(keywords)
+        parts.insert(rng.randrange(len(parts) + 1), keyword.upper() if rng.random() < 0.2 else keyword)
+    glue = "" if rng.random() < 0.1 else " "
+    return glue.join(parts)
+
+
+def check_scores(issues_tool: OrderIssuesTool, inquiry_tool: GeneralInquiryTool):
+    # "broken" is listed under both damaged and defective, so it credits both categories
+    assert issues_tool.score_issue("It arrived BROKEN, the box was broken and it is late") == {
+        "not_received": 0, "damaged": 2, "wrong_item": 0, "defective": 2, "late_delivery": 1,
+    }
+    assert issues_tool.classify_issue("It arrived BROKEN, the box was broken and it is late") == "damaged"
+    # No keyword at all: every category is present with 0 and the default category is used
+    assert issues_tool.score_issue("Thanks for the quick reply") == dict.fromkeys(OrderIssuesTool.issue_keywords, 0)
+    assert issues_tool.classify_issue("Thanks for the quick reply") == "general_issue"
+    assert inquiry_tool.score_inquiry("I want to complain. Email me, or phone me") == {
+        "complaint": 1, "feedback": 0, "business_hours": 0, "contact_info": 2,
+    }
+    assert inquiry_tool.score_inquiry("") == dict.fromkeys(GeneralInquiryTool.inquiry_keywords, 0)
+    print("score_issue / score_inquiry: counts match the expected values")
+
+
+def run(name: str, legacy, current, keyword_table: dict, count: int = 2000, words: int = 300):
+    rng = random.Random(42)
+    keywords = [keyword for words_list in keyword_table.values() for keyword in words_list]
+    texts = [make_text(keywords, rng, words) for _ in range(count)]
+
+    mismatches = sum(legacy(text) != current(text) for text in texts)
+
+    timings = {}
+    for label, classify in (("if/elif", legacy), ("KeywordClassifier", current)):
+        start = time.perf_counter()
+        for text in texts:
+            classify(text)
+        timings[label] = count / (time.perf_counter() - start)
+
+    print(f"{name}: {count} texts x ~{words} words, mismatches vs if/elif = {mismatches}")
+    for label, rate in timings.items():
+        print(f"  {label:<18} {rate:>12,.0f} classifications/sec")
+
+
+if __name__ == "__main__":
+    issues_tool = OrderIssuesTool()
+    inquiry_tool = GeneralInquiryTool()
+    check_scores(issues_tool, inquiry_tool)
+    run("classify_issue", legacy_classify_issue, issues_tool.classify_issue, OrderIssuesTool.issue_keywords)
+    run("classify_inquiry", legacy_classify_inquiry, inquiry_tool.classify_inquiry, GeneralInquiryTool.inquiry_keywords)
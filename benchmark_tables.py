@@ -0,0 +1,98 @@
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from Jeyaram_chatbot import ORDER_SCHEMA, PRODUCT_SCHEMA, CompactTable, OrderDBTool, ProductInfoTool
+
+STATUSES = ["Shipped", "Processing", "Delivered", "Cancelled"]
+
+
+def make_orders(count: int, rng: random.Random) -> dict:
+    # Same shape as OrderDBTool.dummy_orders, only much bigger
+    orders = {}
+    for number in range(count):
+        status = rng.choice(STATUSES)
+        day = f"2025-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}"
+        field = "delivery_date" if status == "Delivered" else "estimated_delivery"
+        orders[f"ORD{number:08d}"] = {"status": status, field: day}
+    return orders
+
+
+def check_tools(orders_table, products_table):
+    # The tools must answer exactly the same with a CompactTable as with the dummy dictionaries
+    for tool, table, queries in (
+        (OrderDBTool, orders_table, ["ORD123", "ord789 ", "ORD741", "ORD999", "", "ORD\udcff"]),
+        (ProductInfoTool, products_table, ["Laptop", "gaming keyboard", "mouse pad", "phone", "o", "lap\udcfftop"]),
+    ):
+        dict_tool, table_tool = tool(), tool(table)
+        for query in queries:
+            assert dict_tool.execute(query) == table_tool.execute(query), (tool.__name__, query)
+
+
+def check_records(path: str):
+    # Records whose keys are not in schema order must come back unchanged (same json.dumps output)
+    orders = {
+        "ORD1": {"delivery_date": "2025-05-10", "status": "Delivered"},
+        "ORD2": {"status": "Shipped", "estimated_delivery": "2025-05-15"},
+        "ORD3": {"estimated_delivery": "2025-05-18"},
+    }
+    CompactTable.from_records(orders, ORDER_SCHEMA).save(path)
+    table = CompactTable.load(path)
+    for key, record in orders.items():
+        assert json.dumps(table[key]) == json.dumps(record), key
+    del table
+
+    # Values that could not be stored and read back unchanged are rejected before anything is written
+    for record in ({"status": 5}, {"status": "Shipped", "delivery_date": 20250101}, {"status": None}):
+        try:
+            CompactTable.from_records({"ORD1": record}, ORDER_SCHEMA)
+        except ValueError:
+            continue
+        raise AssertionError(f"{record} was accepted")
+
+
+def time_lookups(table, keys: list) -> float:
+    # Same access pattern as OrderDBTool.execute(): `in` first, then []
+    start = time.perf_counter()
+    for key in keys:
+        if key in table:
+            table[key]
+    return (time.perf_counter() - start) / len(keys) * 1e6 # microseconds per lookup
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    rng = random.Random(7)
+
+    with tempfile.TemporaryDirectory() as folder:
+        # Small tables from the tools themselves: round trip through a file and check behavior
+        orders_path, products_path = os.path.join(folder, "orders.tbl"), os.path.join(folder, "products.tbl")
+        CompactTable.from_records(OrderDBTool().dummy_orders, ORDER_SCHEMA).save(orders_path)
+        CompactTable.from_records(ProductInfoTool().dummy_products, PRODUCT_SCHEMA).save(products_path)
+        check_tools(CompactTable.load(orders_path), CompactTable.load(products_path))
+        print("OrderDBTool / ProductInfoTool: identical responses with CompactTable")
+        check_records(os.path.join(folder, "records.tbl"))
+        print("CompactTable: field order kept, invalid values rejected")
+
+        tracemalloc.start()
+        orders = make_orders(count, rng)
+        dict_bytes = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        path = os.path.join(folder, "big_orders.tbl")
+        CompactTable.from_records(orders, ORDER_SCHEMA).save(path)
+        table = CompactTable.load(path)
+
+        keys = rng.sample(list(orders), min(count, 200_000))
+        assert all(table[key] == orders[key] for key in keys[:10_000])
+        assert list(table)[:1000] == list(orders)[:1000]
+
+        print(f"{count:,} orders")
+        print(f"  dict of dicts      {dict_bytes / count:8.1f} bytes/record   {time_lookups(orders, keys):6.2f} us/lookup (in + [])")
+        print(f"  CompactTable mmap  {table.nbytes() / count:8.1f} bytes/record   {time_lookups(table, keys):6.2f} us/lookup (in + [])")
+        print(f"  (file on disk incl. header: {os.path.getsize(path):,} bytes)")
+        del table # Release the memory-mapped file before the folder is removed